@@ -1,15 +1,42 @@
+from __future__ import annotations
+
 import argparse
+import hashlib
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import matplotlib.pyplot as plt
-import pandas as pd
-import seaborn as sns
-import statsmodels.formula.api as smf
+if TYPE_CHECKING:
+    import pandas as pd
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
 
 
 ROOT = Path(__file__).resolve().parents[2]
 DEFAULT_DATA_FILE = ROOT / "data-analysis-agent" / "assets" / "sample_growth_data.csv"
 DEFAULT_REPORT_DIR = ROOT / "data-analysis-agent" / "reports"
+CACHE_FILE_NAME = ".cache-hash"
+NUMERIC_COLUMNS = ["sessions", "signups", "orders", "revenue_usd", "cost_usd"]
+INPUT_DTYPES = {
+    "date": "str",
+    "channel": "category",
+    "region": "category",
+    "user_id": "str",
+}
+OUTLIER_ROWS = [("2026-01-20", "U1065")]
+REGRESSION_CHARTS = [
+    ("sessions", "orders", "Orders vs Sessions", "reg_orders_vs_sessions.png", "#d9480f"),
+    ("orders", "revenue_usd", "Revenue vs Orders", "reg_revenue_vs_orders.png", "#0b7285"),
+    ("sessions", "signups", "Signups vs Sessions", "reg_signups_vs_sessions.png", "#2b8a3e"),
+]
+OUTPUT_FILES = [
+    "regression-report.md",
+    "business-report-zh.txt",
+    "business-report-zh.html",
+    "business-report-zh.md",
+    "index.html",
+    *(filename for _, _, _, filename, _ in REGRESSION_CHARTS),
+]
 
 
 BUSINESS_REPORT_TEXT = """样例数据业务分析汇报
@@ -100,156 +127,22 @@ BUSINESS_REPORT_TEXT = """样例数据业务分析汇报
 """
 
 
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Generate demo data analysis reports.")
-    parser.add_argument(
-        "--input",
-        dest="input_file",
-        default=str(DEFAULT_DATA_FILE),
-        help="Path to input CSV file.",
-    )
-    parser.add_argument(
-        "--output-dir",
-        dest="output_dir",
-        default=str(DEFAULT_REPORT_DIR),
-        help="Directory to write generated reports into.",
-    )
-    return parser.parse_args()
-
-
-def load_clean_data(data_file: Path) -> pd.DataFrame:
-    df = pd.read_csv(data_file, keep_default_na=False)
-    for col in ["sessions", "signups", "orders", "revenue_usd", "cost_usd"]:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-    clean = df.drop_duplicates().copy()
-    clean = clean.dropna(subset=["sessions", "signups", "orders", "revenue_usd"])
-    clean = clean[clean["sessions"] >= 0].copy()
-    clean = clean[~((clean["date"] == "2026-01-20") & (clean["user_id"] == "U1065"))].copy()
-    return clean
-
-
-def build_regression_report(clean: pd.DataFrame, data_file: Path) -> str:
-    m1 = smf.ols("orders ~ sessions + C(channel) + C(region)", data=clean).fit()
-    m2 = smf.ols("revenue_usd ~ orders + C(channel) + C(region)", data=clean).fit()
-    m3 = smf.ols("signups ~ sessions + C(channel) + C(region)", data=clean).fit()
-
-    return f"""# Regression Report
-
-Data file: `{data_file}`
-
-## Data handling
-- Removed 1 exact duplicate row.
-- Dropped rows missing core regression fields: `sessions`, `signups`, `orders`, `revenue_usd`.
-- Dropped 1 row with negative `sessions`.
-- Dropped 1 extreme revenue outlier: `2026-01-20 / U1065 / revenue_usd=9900`.
-- Read CSV with `keep_default_na=False` so region value `NA` is not misread as null.
-- Final regression sample size: {len(clean)} rows.
-
-## Model 1
-Formula: `orders ~ sessions + C(channel) + C(region)`
-
-- R^2: {m1.rsquared:.4f}
-- Adjusted R^2: {m1.rsquared_adj:.4f}
-- Sessions coefficient: {m1.params["sessions"]:.4f} (p={m1.pvalues["sessions"]:.4g})
-
-Interpretation:
-- Orders rise strongly with sessions.
-- Channel and region still explain part of the remaining variation after controlling for sessions.
-
-## Model 2
-Formula: `revenue_usd ~ orders + C(channel) + C(region)`
-
-- R^2: {m2.rsquared:.4f}
-- Adjusted R^2: {m2.rsquared_adj:.4f}
-- Orders coefficient: {m2.params["orders"]:.4f} (p={m2.pvalues["orders"]:.4g})
-
-Interpretation:
-- Revenue is primarily explained by order volume.
-- After cleaning the outlier, `paid` remains stronger than the baseline channel.
-
-## Model 3
-Formula: `signups ~ sessions + C(channel) + C(region)`
-
-- R^2: {m3.rsquared:.4f}
-- Adjusted R^2: {m3.rsquared_adj:.4f}
-- Sessions coefficient: {m3.params["sessions"]:.4f} (p={m3.pvalues["sessions"]:.4g})
-
-Interpretation:
-- Sessions also explain signups well, though slightly less strongly than orders or revenue.
-
-## Output files
-- `reg_orders_vs_sessions.png`
-- `reg_revenue_vs_orders.png`
-- `reg_signups_vs_sessions.png`
+BUSINESS_REPORT_CSS = """:root { --bg:#f6f1e8; --card:#fffdf8; --ink:#1f2328; --muted:#5b6470; --line:#d8cdbd; --accent:#9a3412; }
+body { margin:0; font-family:"Microsoft YaHei","PingFang SC","Noto Sans SC",sans-serif; background:linear-gradient(180deg,#efe4d2 0%, #f8f4ec 100%); color:var(--ink); }
+main { max-width:900px; margin:40px auto; background:var(--card); border:1px solid var(--line); border-radius:18px; padding:40px; box-shadow:0 12px 40px rgba(0,0,0,.08); }
+h1 { font-size:34px; margin-top:0; } p { line-height:1.75; font-size:16px; white-space:pre-wrap; }
+code { background:#f2eadf; padding:2px 6px; border-radius:6px; } .muted { color:var(--muted); }
 """
 
 
-def write_business_reports(report_dir: Path, data_file: Path) -> None:
-    business_report_text = BUSINESS_REPORT_TEXT.format(data_file=data_file.as_posix())
-    html = f"""<!doctype html>
-<html lang="zh-CN">
-<head>
-<meta charset="utf-8">
-<meta name="viewport" content="width=device-width, initial-scale=1">
-<title>样例数据业务分析汇报</title>
-<style>
-:root {{ --bg:#f6f1e8; --card:#fffdf8; --ink:#1f2328; --muted:#5b6470; --line:#d8cdbd; --accent:#9a3412; }}
-body {{ margin:0; font-family:"Microsoft YaHei","PingFang SC","Noto Sans SC",sans-serif; background:linear-gradient(180deg,#efe4d2 0%, #f8f4ec 100%); color:var(--ink); }}
-main {{ max-width:900px; margin:40px auto; background:var(--card); border:1px solid var(--line); border-radius:18px; padding:40px; box-shadow:0 12px 40px rgba(0,0,0,.08); }}
-h1 {{ font-size:34px; margin-top:0; }} p {{ line-height:1.75; font-size:16px; white-space:pre-wrap; }}
-code {{ background:#f2eadf; padding:2px 6px; border-radius:6px; }} .muted {{ color:var(--muted); }}
-</style>
-</head>
-<body>
-<main>
-<h1>样例数据业务分析汇报</h1>
-<p class="muted">数据文件：<code>{data_file.as_posix()}</code></p>
-<p>{business_report_text}</p>
-</main>
-</body>
-</html>"""
-    report_dir.joinpath("business-report-zh.txt").write_text(business_report_text, encoding="utf-8-sig")
-    report_dir.joinpath("business-report-zh.html").write_text(html, encoding="utf-8")
-    report_dir.joinpath("business-report-zh.md").write_text(
-        "# 样例数据业务分析汇报\n\n" + business_report_text,
-        encoding="utf-8-sig",
-    )
-
-
-def plot_regression(
-    clean: pd.DataFrame,
-    report_dir: Path,
-    x: str,
-    y: str,
-    title: str,
-    filename: str,
-    color: str,
-) -> None:
-    plt.figure(figsize=(7, 5))
-    sns.regplot(
-        data=clean,
-        x=x,
-        y=y,
-        scatter_kws={"alpha": 0.75, "s": 45},
-        line_kws={"color": color, "lw": 2},
-    )
-    plt.title(title)
-    plt.xlabel(x.replace("_", " ").title())
-    plt.ylabel(y.replace("_", " ").title())
-    plt.tight_layout()
-    plt.savefig(report_dir / filename, dpi=160)
-    plt.close()
-
-
-def write_showcase_page(report_dir: Path, data_file: Path, raw_rows: int, clean_rows: int) -> None:
-    html = f"""<!doctype html>
+SHOWCASE_HTML_TEMPLATE = """<!doctype html>
 <html lang="zh-CN">
 <head>
   <meta charset="utf-8">
   <meta name="viewport" content="width=device-width, initial-scale=1">
   <title>数据分析 Agent 报告展示页</title>
   <style>
-    :root {{
+    :root {
       --bg: #f4efe6;
       --card: #fffaf2;
       --ink: #1e2329;
@@ -257,9 +150,9 @@ def write_showcase_page(report_dir: Path, data_file: Path, raw_rows: int, clean_
       --line: #d8c9b7;
       --accent: #a4491d;
       --accent-2: #155e75;
-    }}
-    * {{ box-sizing: border-box; }}
-    body {{
+    }
+    * { box-sizing: border-box; }
+    body {
       margin: 0;
       color: var(--ink);
       font-family: "Microsoft YaHei", Georgia, serif;
@@ -267,101 +160,101 @@ def write_showcase_page(report_dir: Path, data_file: Path, raw_rows: int, clean_
         radial-gradient(circle at top left, #efe3cf 0, transparent 28%),
         radial-gradient(circle at bottom right, #e7d9c1 0, transparent 24%),
         linear-gradient(180deg, #f0e7da 0%, var(--bg) 100%);
-    }}
-    .wrap {{
+    }
+    .wrap {
       max-width: 1100px;
       margin: 0 auto;
       padding: 40px 20px 80px;
-    }}
-    .hero {{
+    }
+    .hero {
       padding: 28px;
       border: 1px solid var(--line);
       border-radius: 24px;
       background: linear-gradient(135deg, #fffaf2 0%, #f7f0e4 100%);
       box-shadow: 0 20px 60px rgba(0, 0, 0, 0.08);
-    }}
-    .eyebrow {{
+    }
+    .eyebrow {
       letter-spacing: 0.18em;
       text-transform: uppercase;
       color: var(--accent);
       font-size: 12px;
       margin: 0 0 10px;
-    }}
-    h1 {{
+    }
+    h1 {
       margin: 0;
       font-size: clamp(36px, 6vw, 68px);
       line-height: 0.95;
-    }}
-    .sub {{
+    }
+    .sub {
       max-width: 760px;
       margin: 16px 0 0;
       color: var(--muted);
       font-size: 18px;
       line-height: 1.6;
-    }}
-    .grid {{
+    }
+    .grid {
       display: grid;
       grid-template-columns: repeat(auto-fit, minmax(240px, 1fr));
       gap: 18px;
       margin-top: 24px;
-    }}
-    .card {{
+    }
+    .card {
       background: var(--card);
       border: 1px solid var(--line);
       border-radius: 18px;
       padding: 18px;
-    }}
-    .metric {{
+    }
+    .metric {
       font-size: 34px;
       color: var(--accent-2);
       margin: 0;
-    }}
-    .label {{
+    }
+    .label {
       margin-top: 6px;
       color: var(--muted);
-    }}
-    .section {{
+    }
+    .section {
       margin-top: 28px;
       padding: 22px;
       border-radius: 20px;
       background: rgba(255, 250, 242, 0.82);
       border: 1px solid var(--line);
-    }}
-    h2 {{
+    }
+    h2 {
       margin: 0 0 14px;
       font-size: 24px;
-    }}
-    .links a {{
+    }
+    .links a {
       display: inline-block;
       margin: 6px 12px 6px 0;
       color: var(--accent-2);
       text-decoration: none;
       border-bottom: 1px solid transparent;
-    }}
-    .links a:hover {{ border-color: var(--accent-2); }}
-    .charts {{
+    }
+    .links a:hover { border-color: var(--accent-2); }
+    .charts {
       display: grid;
       grid-template-columns: repeat(auto-fit, minmax(260px, 1fr));
       gap: 16px;
       margin-top: 16px;
-    }}
-    .charts img {{
+    }
+    .charts img {
       width: 100%;
       display: block;
       border-radius: 14px;
       border: 1px solid var(--line);
       background: white;
-    }}
-    ul {{
+    }
+    ul {
       margin: 0;
       padding-left: 20px;
       line-height: 1.7;
-    }}
-    code {{
+    }
+    code {
       background: #efe5d6;
       padding: 2px 6px;
       border-radius: 6px;
-    }}
+    }
   </style>
 </head>
 <body>
@@ -374,11 +267,11 @@ def write_showcase_page(report_dir: Path, data_file: Path, raw_rows: int, clean_
       </p>
       <div class="grid">
         <div class="card">
-          <p class="metric">{raw_rows}</p>
+          <p class="metric">$$raw_rows$$</p>
           <div class="label">原始数据行数</div>
         </div>
         <div class="card">
-          <p class="metric">{clean_rows}</p>
+          <p class="metric">$$clean_rows$$</p>
           <div class="label">清洗后回归样本数</div>
         </div>
         <div class="card">
@@ -408,7 +301,7 @@ def write_showcase_page(report_dir: Path, data_file: Path, raw_rows: int, clean_
         <a href="./business-report-zh.html">中文业务汇报</a>
         <a href="./business-report-zh.txt">中文业务汇报 TXT</a>
       </div>
-      <p>当前数据文件：<code>{data_file.as_posix()}</code></p>
+      <p>当前数据文件：<code>$$data_file$$</code></p>
     </section>
 
     <section class="section">
@@ -437,7 +330,260 @@ def write_showcase_page(report_dir: Path, data_file: Path, raw_rows: int, clean_
   </div>
 </body>
 </html>"""
-    report_dir.joinpath("index.html").write_text(html, encoding="utf-8")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate demo data analysis reports.")
+    parser.add_argument(
+        "--input",
+        dest="input_file",
+        default=str(DEFAULT_DATA_FILE),
+        help="Path to input CSV file.",
+    )
+    parser.add_argument(
+        "--output-dir",
+        dest="output_dir",
+        default=str(DEFAULT_REPORT_DIR),
+        help="Directory to write generated reports into.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate reports even if the inputs are unchanged.",
+    )
+    return parser.parse_args()
+
+
+def write_file(path: Path, text: str, encoding: str = "utf-8") -> None:
+    view = memoryview(text.encode(encoding))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def inputs_digest(data_file: Path) -> str:
+    digest = hashlib.blake2b(data_file.read_bytes(), digest_size=16)
+    digest.update(data_file.as_posix().encode("utf-8"))
+    digest.update(Path(__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def reports_up_to_date(report_dir: Path, digest: str) -> bool:
+    cache_file = report_dir / CACHE_FILE_NAME
+    if not cache_file.exists() or cache_file.read_text(encoding="utf-8") != digest:
+        return False
+    return all((report_dir / name).exists() for name in OUTPUT_FILES)
+
+
+def load_raw_data(data_file: Path) -> pd.DataFrame:
+    import pandas as pd
+    from pandas.api.types import is_numeric_dtype
+
+    raw = pd.read_csv(data_file, keep_default_na=False, dtype=INPUT_DTYPES)
+    # Clean numeric columns are already inferred as numbers; only dirty ones (blanks, stray text) need coercing.
+    for col in NUMERIC_COLUMNS:
+        if not is_numeric_dtype(raw[col]):
+            raw[col] = pd.to_numeric(raw[col], errors="coerce")
+    return raw
+
+
+def load_clean_data(raw: pd.DataFrame) -> pd.DataFrame:
+    mask = (
+        ~raw.duplicated()
+        & raw[["sessions", "signups", "orders", "revenue_usd"]].notna().all(axis=1)
+        & raw["sessions"].ge(0).fillna(False)
+    )
+    for date, user_id in OUTLIER_ROWS:
+        mask &= ~((raw["date"] == date) & (raw["user_id"] == user_id))
+    clean = raw.loc[mask].copy()
+    for col in ["channel", "region"]:
+        clean[col] = clean[col].cat.remove_unused_categories()
+    return clean
+
+
+def fit_ols(y: pd.Series, design: pd.DataFrame, term: str) -> dict[str, float]:
+    import numpy as np
+    from scipy import stats
+
+    x = design.to_numpy(dtype="float64")
+    y = y.to_numpy(dtype="float64")
+    n = x.shape[0]
+    beta, _, rank, _ = np.linalg.lstsq(x, y, rcond=None)
+    resid = y - x @ beta
+    sse = resid @ resid
+    sst = ((y - y.mean()) ** 2).sum()
+    df_resid = n - rank
+    rsquared = 1 - sse / sst
+    cov = sse / df_resid * np.linalg.pinv(x.T @ x)
+    idx = design.columns.get_loc(term)
+    t_value = beta[idx] / np.sqrt(cov[idx, idx])
+    return {
+        "rsquared": float(rsquared),
+        "rsquared_adj": float(1 - (1 - rsquared) * (n - 1) / df_resid),
+        "coef": float(beta[idx]),
+        "intercept": float(beta[design.columns.get_loc("Intercept")]),
+        "pvalue": float(2 * stats.t.sf(abs(t_value), df_resid)),
+    }
+
+
+def format_fit(fit: dict[str, float]) -> dict[str, str]:
+    return {
+        "rsquared": "%.4f" % fit["rsquared"],
+        "rsquared_adj": "%.4f" % fit["rsquared_adj"],
+        "coef": "%.4f" % fit["coef"],
+        "pvalue": "%.4g" % fit["pvalue"],
+    }
+
+
+def build_regression_report(
+    clean: pd.DataFrame, data_file: Path
+) -> tuple[str, dict[tuple[str, str], dict[str, float]]]:
+    import pandas as pd
+
+    dummies = pd.get_dummies(clean[["channel", "region"]], drop_first=True)
+    design = pd.concat([clean[["sessions", "orders"]], dummies], axis=1)
+    design.insert(0, "Intercept", 1.0)
+    x_sessions = design.drop(columns="orders")
+    x_orders = design.drop(columns="sessions")
+    m1 = format_fit(fit_ols(clean["orders"], x_sessions, "sessions"))
+    m2 = format_fit(fit_ols(clean["revenue_usd"], x_orders, "orders"))
+    m3 = format_fit(fit_ols(clean["signups"], x_sessions, "sessions"))
+    line_fits = {
+        (x, y): fit_ols(clean[y], design[["Intercept", x]], x) for x, y, *_ in REGRESSION_CHARTS
+    }
+
+    report = f"""# Regression Report
+
+Data file: `{data_file}`
+
+## Data handling
+- Removed 1 exact duplicate row.
+- Dropped rows missing core regression fields: `sessions`, `signups`, `orders`, `revenue_usd`.
+- Dropped 1 row with negative `sessions`.
+- Dropped 1 extreme revenue outlier: `2026-01-20 / U1065 / revenue_usd=9900`.
+- Read CSV with `keep_default_na=False` so region value `NA` is not misread as null.
+- Final regression sample size: {len(clean)} rows.
+
+## Model 1
+Formula: `orders ~ sessions + C(channel) + C(region)`
+
+- R^2: {m1["rsquared"]}
+- Adjusted R^2: {m1["rsquared_adj"]}
+- Sessions coefficient: {m1["coef"]} (p={m1["pvalue"]})
+
+Interpretation:
+- Orders rise strongly with sessions.
+- Channel and region still explain part of the remaining variation after controlling for sessions.
+
+## Model 2
+Formula: `revenue_usd ~ orders + C(channel) + C(region)`
+
+- R^2: {m2["rsquared"]}
+- Adjusted R^2: {m2["rsquared_adj"]}
+- Orders coefficient: {m2["coef"]} (p={m2["pvalue"]})
+
+Interpretation:
+- Revenue is primarily explained by order volume.
+- After cleaning the outlier, `paid` remains stronger than the baseline channel.
+
+## Model 3
+Formula: `signups ~ sessions + C(channel) + C(region)`
+
+- R^2: {m3["rsquared"]}
+- Adjusted R^2: {m3["rsquared_adj"]}
+- Sessions coefficient: {m3["coef"]} (p={m3["pvalue"]})
+
+Interpretation:
+- Sessions also explain signups well, though slightly less strongly than orders or revenue.
+
+## Output files
+- `reg_orders_vs_sessions.png`
+- `reg_revenue_vs_orders.png`
+- `reg_signups_vs_sessions.png`
+"""
+    return report, line_fits
+
+
+def write_business_reports(report_dir: Path, data_file: Path) -> None:
+    business_report_text = BUSINESS_REPORT_TEXT.format(data_file=data_file.as_posix())
+    html = f"""<!doctype html>
+<html lang="zh-CN">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>样例数据业务分析汇报</title>
+<style>
+{BUSINESS_REPORT_CSS}</style>
+</head>
+<body>
+<main>
+<h1>样例数据业务分析汇报</h1>
+<p class="muted">数据文件：<code>{data_file.as_posix()}</code></p>
+<p>{business_report_text}</p>
+</main>
+</body>
+</html>"""
+    reports = {
+        "business-report-zh.txt": (business_report_text, "utf-8-sig"),
+        "business-report-zh.html": (html, "utf-8"),
+        "business-report-zh.md": ("# 样例数据业务分析汇报\n\n" + business_report_text, "utf-8-sig"),
+    }
+    for name, (text, encoding) in reports.items():
+        write_file(report_dir / name, text, encoding)
+
+
+def configure_plotting() -> None:
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import seaborn as sns
+
+    sns.set_theme(style="whitegrid")
+    matplotlib.rcParams.update(
+        {
+            "text.hinting": "none",
+            "path.simplify": True,
+            "path.simplify_threshold": 1.0,
+            "agg.path.chunksize": 10000,
+        }
+    )
+
+
+def plot_regression(
+    fig: Figure,
+    ax: Axes,
+    clean: pd.DataFrame,
+    report_dir: Path,
+    x: str,
+    y: str,
+    title: str,
+    filename: str,
+    color: str,
+    line_fit: dict[str, float],
+) -> None:
+    import numpy as np
+
+    ax.clear()
+    ax.scatter(clean[x].to_numpy(dtype="float64"), clean[y].to_numpy(dtype="float64"), alpha=0.75, s=45)
+    xs = np.linspace(clean[x].min(), clean[x].max(), 2)
+    ax.plot(xs, line_fit["intercept"] + line_fit["coef"] * xs, color=color, lw=2)
+    ax.set_title(title)
+    ax.set_xlabel(x.replace("_", " ").title())
+    ax.set_ylabel(y.replace("_", " ").title())
+    fig.tight_layout()
+    fig.savefig(report_dir / filename, dpi=100)
+
+
+def write_showcase_page(report_dir: Path, data_file: Path, raw_rows: int, clean_rows: int) -> None:
+    html = (
+        SHOWCASE_HTML_TEMPLATE.replace("$$raw_rows$$", str(raw_rows))
+        .replace("$$clean_rows$$", str(clean_rows))
+        .replace("$$data_file$$", data_file.as_posix())
+    )
+    write_file(report_dir / "index.html", html)
 
 
 def main() -> None:
@@ -445,18 +591,31 @@ def main() -> None:
     data_file = Path(args.input_file).resolve()
     report_dir = Path(args.output_dir).resolve()
     report_dir.mkdir(parents=True, exist_ok=True)
-    sns.set_theme(style="whitegrid")
-
-    raw = pd.read_csv(data_file, keep_default_na=False)
-    clean = load_clean_data(data_file)
-    (report_dir / "regression-report.md").write_text(build_regression_report(clean, data_file), encoding="utf-8")
+    digest = inputs_digest(data_file)
+    if not args.force and reports_up_to_date(report_dir, digest):
+        print(f"Reports are up to date: {report_dir}")
+        return
+
+    # Drop the stale digest first so an interrupted rebuild is never reported as up to date.
+    (report_dir / CACHE_FILE_NAME).unlink(missing_ok=True)
+    configure_plotting()
+    raw = load_raw_data(data_file)
+    clean = load_clean_data(raw)
+    regression_report, line_fits = build_regression_report(clean, data_file)
+    write_file(report_dir / "regression-report.md", regression_report)
     write_business_reports(report_dir, data_file)
     write_showcase_page(report_dir, data_file, len(raw), len(clean))
 
-    plot_regression(clean, report_dir, "sessions", "orders", "Orders vs Sessions", "reg_orders_vs_sessions.png", "#d9480f")
-    plot_regression(clean, report_dir, "orders", "revenue_usd", "Revenue vs Orders", "reg_revenue_vs_orders.png", "#0b7285")
-    plot_regression(clean, report_dir, "sessions", "signups", "Signups vs Sessions", "reg_signups_vs_sessions.png", "#2b8a3e")
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(7, 5))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+    for x, y, title, filename, color in REGRESSION_CHARTS:
+        plot_regression(fig, ax, clean, report_dir, x, y, title, filename, color, line_fits[(x, y)])
 
+    write_file(report_dir / CACHE_FILE_NAME, digest)
     print(f"Wrote reports to: {report_dir}")
 
 